@@ -0,0 +1,23 @@
+-- Make lower(email) the single uniqueness rule on users.email.
+--
+-- add_if_absent runs INSERT ... ON CONFLICT (lower(email)) DO NOTHING. That
+-- needs a unique index on exactly lower(email); any other unique index on
+-- email would still raise on a racing duplicate instead of being skipped.
+--
+-- Run once against databases created before the change (new ones get this
+-- schema from metadata.create_all). If two rows share an email up to case, the
+-- UPDATE aborts first: lowercasing one of them collides with the other on the
+-- still-present unique ix_users_email, and the whole transaction rolls back.
+-- Find such rows with
+--   SELECT lower(email) FROM users GROUP BY 1 HAVING count(*) > 1;
+-- and merge those accounts before running this file.
+
+BEGIN;
+
+UPDATE users SET email = lower(email) WHERE email <> lower(email);
+
+CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email_lower ON users (lower(email));
+
+DROP INDEX IF EXISTS ix_users_email;
+
+COMMIT;
@@ -0,0 +1,27 @@
+"""Build hook: optionally compile pure-Python hot paths with Cython.
+
+Compilation is opt-in; a plain ``pip install`` builds a pure-Python package and
+needs neither Cython nor a C compiler. To compile, install Cython and set
+``CLEAN_PYTHON_CYTHON=1``:
+
+    CLEAN_PYTHON_CYTHON=1 python setup.py build_ext --inplace
+
+Only the ORM adapter is compiled. ``src/domain/models.py`` stays interpreted
+because Pydantic rejects Cython-bound methods on ``BaseModel`` subclasses.
+An in-place ``src/adapters/orm.*.so`` is imported ahead of ``orm.py``, so
+rebuild or delete it after editing the adapter.
+"""
+import os
+
+from setuptools import find_packages, setup
+
+ext_modules = []
+if os.environ.get("CLEAN_PYTHON_CYTHON") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(["src/adapters/orm.py"], language_level=3)
+
+setup(
+    packages=find_packages(include=["src", "src.*"]),
+    ext_modules=ext_modules,
+)
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
-from sqlalchemy import Boolean, DateTime, String, select
+from typing import Any, Optional, cast
+from uuid import UUID
+from sqlalchemy import Boolean, DateTime, Index, Insert, Row, String, bindparam, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.adapters.cache import TtlCache
 from src.domain.models import User
 from src.domain.ports import UserRepository
 
@@ -24,32 +27,68 @@ class UserRecord(Base):
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     username: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
-    email: Mapped[str] = mapped_column(String(255), nullable=False, unique=True, index=True)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=False), default=datetime.utcnow, nullable=False)
+    # No ORM-side default: the domain User stamps created_at, so rows carry that one clock read.
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=False), nullable=False)
+
+    # Emails are case-insensitive: one account per lower(email), served by an index lookup.
+    # It is the only unique rule on email, so ON CONFLICT (lower(email)) settles every race.
+    # Existing databases: apply migrations/0001_users_email_lower.sql.
+    __table_args__ = (Index("ix_users_email_lower", func.lower(email), unique=True),)
+
+
+# Built once at import; SQLAlchemy reuses the compiled SQL on every call.
+# Selects the Core table, so rows skip ORM entity and identity-map overhead.
+_users_table = UserRecord.__table__
+_GET_BY_EMAIL = select(_users_table).where(func.lower(_users_table.c.email) == bindparam("email"))
+
+# "Known absent" lookups expire quickly so new registrations elsewhere show up.
+_NEGATIVE_TTL_SECONDS = 1.0
+_MISS = object()
+
+
+# Rows per executemany call; bounds parameter-buffer memory on large imports.
+_INSERT_BATCH_SIZE = 1000
+
+
+def _to_row(user: User) -> dict[str, Any]:
+    """Translate a domain User into a column mapping."""
+    return {
+        "id": str(user.id),
+        "username": user.username,
+        "email": user.email,
+        "is_active": user.is_active,
+        "created_at": user.created_at,
+    }
+
+
+def _insert_unless_email_taken(dialect: str, row: dict[str, Any]) -> Insert:
+    """INSERT ... ON CONFLICT (lower(email)) DO NOTHING for dialects that support it."""
+    conflict_target = [func.lower(UserRecord.email)]
+    if dialect == "postgresql":
+        return postgresql.insert(UserRecord).values(row).on_conflict_do_nothing(index_elements=conflict_target)
+    if dialect == "sqlite":
+        return sqlite.insert(UserRecord).values(row).on_conflict_do_nothing(index_elements=conflict_target)
+    raise NotImplementedError(f"add_if_absent does not support the {dialect!r} dialect")
 
 
 def _to_record(user: User) -> UserRecord:
     """Translate a domain User into a persistence record."""
-    return UserRecord(
-        id=str(user.id),
-        username=user.username,
-        email=user.email,
-        is_active=user.is_active,
-        created_at=user.created_at,
-    )
+    return UserRecord(**_to_row(user))
+
 
+def _to_domain(record: UserRecord | Row[Any]) -> User:
+    """Translate a persistence record (or users-table row) into a domain User.
 
-def _to_domain(record: UserRecord) -> User:
-    """Translate a persistence record into a domain User."""
-    return User.model_validate(
-        {
-            "id": record.id,
-            "username": record.username,
-            "email": record.email,
-            "is_active": record.is_active,
-            "created_at": record.created_at,
-        }
+    Rows were validated on the way in, so rehydration skips Pydantic validation.
+    """
+    return User.fast_new(
+        id=UUID(record.id),
+        username=record.username,
+        email=record.email,
+        is_active=record.is_active,
+        created_at=record.created_at,
     )
 
 
@@ -59,8 +98,11 @@ class SqlAlchemyUserRepository(UserRepository):
     Translates domain calls into SQL via SQLAlchemy.
     """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, cache: Optional[TtlCache] = None):
         self.session = session
+        self.cache = cache
+        # Users written in this transaction; cached by the Unit of Work after COMMIT.
+        self._written: list[User] = []
 
     def add(self, user: User) -> None:
         """Add user to session (synchronous - no I/O).
@@ -68,11 +110,65 @@ class SqlAlchemyUserRepository(UserRepository):
         Note: Does NOT commit. Commits are managed by Unit of Work.
         """
         self.session.add(_to_record(user))
+        self._written.append(user)
 
-    async def get_by_email(self, email: str) -> Optional[User]:
-        stmt = select(UserRecord).where(UserRecord.email == email)
+    async def add_many(self, users: list[User]) -> None:
+        """Insert users in batched executemany round-trips.
+
+        Note: Does NOT commit. Commits are managed by Unit of Work.
+        """
+        for start in range(0, len(users), _INSERT_BATCH_SIZE):
+            rows = [_to_row(u) for u in users[start:start + _INSERT_BATCH_SIZE]]
+            await self.session.execute(insert(UserRecord), rows)
+        self._written.extend(users)
+
+    async def add_if_absent(self, user: User) -> bool:
+        """Insert user unless the email is taken, in one round-trip.
+
+        Runs INSERT ... ON CONFLICT (lower(email)) DO NOTHING RETURNING id, so
+        the unique index decides races. Returns False when the email already exists.
+        A user already in the cache short-circuits, so duplicate retries skip the INSERT.
+        Note: Does NOT commit. Commits are managed by Unit of Work.
+        """
+        if self.cache is not None and self.cache.get(user.email) is not None:
+            return False  # users are never deleted, so a cached hit is authoritative
+        dialect = self.session.get_bind().dialect.name
+        stmt = _insert_unless_email_taken(dialect, _to_row(user)).returning(UserRecord.id)
         result = await self.session.execute(stmt)
-        record = result.scalar_one_or_none()
-        if record is None:
-            return None
-        return _to_domain(record)
+        inserted = result.scalar_one_or_none() is not None
+        if inserted:
+            self._written.append(user)
+        return inserted
+
+    def publish_written(self) -> None:
+        """Cache the users written since the last commit; call after COMMIT.
+
+        Overwrites any "absent" another session cached before the rows became
+        visible, and lets duplicate registrations be refused from the cache.
+        """
+        if self.cache is not None:
+            for user in self._written:
+                self.cache.set(user.email, user)
+        self._written.clear()
+
+    def discard_written(self) -> None:
+        """Forget uncommitted writes; call after ROLLBACK."""
+        self._written.clear()
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Look up a user, serving repeats from the shared cache when one is wired.
+
+        Matches case-insensitively; absent results are cached only for
+        _NEGATIVE_TTL_SECONDS so users registered by other workers show up.
+        """
+        email = email.lower()
+        if self.cache is not None:
+            cached = self.cache.get(email, _MISS)
+            if cached is not _MISS:
+                return cast(Optional[User], cached)
+        result = await self.session.execute(_GET_BY_EMAIL, {"email": email})
+        row = result.one_or_none()
+        user = None if row is None else _to_domain(row)
+        if self.cache is not None:
+            self.cache.set(email, user, ttl=_NEGATIVE_TTL_SECONDS if user is None else None)
+        return user
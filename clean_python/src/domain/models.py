@@ -1,31 +1,54 @@
-import re
 from uuid import UUID, uuid4
 from datetime import datetime
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Any
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+
+
+def _is_username_charset(v: str) -> bool:
+    """Equivalent to ^[a-zA-Z][a-zA-Z0-9_]*$ using C-level str methods (no regex engine)."""
+    return v.isascii() and v[0].isalpha() and v.replace("_", "").isalnum()
+
+
+def validate_username(v: str) -> str:
+    """Validate username with comprehensive rules."""
+    if not (3 <= len(v) <= 30):
+        raise ValueError("Username must be 3-30 characters")
+    if not _is_username_charset(v):
+        raise ValueError("Username must start with letter, contain only alphanumeric and underscore")
+    if v.endswith("_"):
+        raise ValueError("Username cannot end with underscore")
+    return v.lower()  # Normalize to lowercase
+
+
+def normalize_email(v: str) -> str:
+    """Emails match case-insensitively, so keep one canonical (lowercase) form."""
+    return v.lower()
+
+
+# Shared by the domain model and inbound DTOs so the rules live in one place.
+Username = Annotated[str, AfterValidator(validate_username)]
+Email = Annotated[str, AfterValidator(normalize_email)]
+
 
 class User(BaseModel):
     """
     Rich Domain Model.
     Contains both data AND business rules validation.
     """
+    # Frozen: the repository cache hands one instance to every caller.
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     id: UUID = Field(default_factory=uuid4)
-    username: str
-    email: str
+    username: Username
+    email: Email
     is_active: bool = True
     created_at: datetime = Field(default_factory=datetime.now)
 
-    @field_validator("username")
     @classmethod
-    def validate_username(cls, v: str) -> str:
-        """Validate username with comprehensive rules."""
-        if len(v) < 3 or len(v) > 30:
-            raise ValueError("Username must be 3-30 characters")
-        if not re.match("^[a-zA-Z][a-zA-Z0-9_]*$", v):
-            raise ValueError("Username must start with letter, contain only alphanumeric and underscore")
-        if v.endswith("_"):
-            raise ValueError("Username cannot end with underscore")
-        return v.lower()  # Normalize to lowercase
-    
+    def fast_new(cls, **data: Any) -> "User":
+        """Build from already-validated data (e.g. persisted rows), skipping validators."""
+        return cls.model_construct(**data)
+
     def can_receive_email(self) -> bool:
         """Pure business logic method."""
         return self.is_active
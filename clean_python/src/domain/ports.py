@@ -11,6 +11,14 @@ class UserRepository(Protocol):
         """Add user to session (synchronous operation)."""
         ...
 
+    async def add_many(self, users: list[User]) -> None:
+        """Insert many users in batched round-trips (async I/O operation)."""
+        ...
+
+    async def add_if_absent(self, user: User) -> bool:
+        """Insert user unless the email exists; False on conflict (async I/O operation)."""
+        ...
+
     async def get_by_email(self, email: str) -> Optional[User]:
         """Retrieve user by email (async I/O operation)."""
         ...
@@ -1,23 +1,30 @@
 import logging
 from typing import Optional
 from fastapi import FastAPI, HTTPException, Depends, status
-from pydantic import BaseModel, ValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from src.domain.models import Email, User, Username
 from src.service_layer import handlers
 from src.service_layer.unit_of_work import AbstractUnitOfWork
-from src.entrypoints.deps import get_uow
-from src.config import settings
+from src.entrypoints.deps import check_io_method, get_uow, warm_pool
+from src.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# The ASGI entrypoint needs title/version up front, so importing this module
+# parses the environment; deps defers everything to first use.
+settings = get_settings()
+
 app = FastAPI(
     title=settings.api_title,
-    version=settings.api_version
+    version=settings.api_version,
+    default_response_class=ORJSONResponse,  # Rust-backed serializer
 )
 
 # DTOs
 class RegisterRequest(BaseModel):
-    username: str
-    email: str
+    username: Username  # Rejected with 422 here, before any DB work
+    email: Email
 
 class UserResponse(BaseModel):
     user_id: str
@@ -46,9 +53,9 @@ async def create_user_endpoint(
 ) -> UserResponse:
     """Register a new user."""
     try:
-        user = await handlers.register_user_service(
-            username=data.username,
-            email=data.email,
+        # RegisterRequest already ran the domain validators; don't run them twice.
+        user = await handlers.register_user(
+            User.fast_new(username=data.username, email=data.email),
             uow=uow
         )
         return UserResponse(
@@ -58,24 +65,24 @@ async def create_user_endpoint(
             is_active=user.is_active
         )
     except ValueError as e:
-        logger.warning(f"User registration conflict: {str(e)}")
+        logger.warning("User registration conflict: %s", e)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail={"error": "User already exists", "code": "USER_EXISTS"}
         )
-    except ValidationError as e:
-        logger.warning(f"Validation error: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail={"error": "Invalid input", "code": "VALIDATION_ERROR"}
-        )
     except Exception as e:
-        logger.error(f"Unexpected error in user registration: {str(e)}", exc_info=True)
+        logger.error("Unexpected error in user registration: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error": "Internal server error", "code": "INTERNAL_ERROR"}
         )
 
+@app.on_event("startup")
+async def on_startup() -> None:
+    """Pre-create pooled DB connections before serving traffic."""
+    await warm_pool()
+    await check_io_method()
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -1,12 +1,108 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+import asyncio
+import logging
+from collections import deque
+from functools import lru_cache
+from typing import Any, AsyncIterator, Optional
 
-from src.config import settings
+from sqlalchemy import make_url, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+
+from src.adapters.cache import TtlCache
+from src.config import Settings, get_settings
 from src.service_layer.unit_of_work import SqlAlchemyUnitOfWork
 
-# Wiring the infrastructure
-engine = create_async_engine(settings.database_url, echo=settings.echo_sql)
-session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+logger = logging.getLogger(__name__)
+
+
+def _engine_options(settings: Settings) -> dict[str, Any]:
+    """Engine tuning; pool and asyncpg knobs apply to Postgres URLs only.
+
+    With asyncpg's prepared-statement caches, repeat queries such as
+    get_by_email reuse a server-side plan after their first execution.
+    """
+    options: dict[str, Any] = {
+        "echo": settings.echo_sql,
+        "pool_pre_ping": True,
+        "query_cache_size": 2000,
+    }
+    if make_url(settings.database_url).get_backend_name() == "postgresql":
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            connect_args={
+                "statement_cache_size": 1024,  # asyncpg
+                "prepared_statement_cache_size": 1024,  # SQLAlchemy asyncpg adapter
+            },
+        )
+    return options
+
+
+# Wiring the infrastructure; engine and sessions are built on first use, so
+# importing this module does not parse the environment.
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    settings = get_settings()
+    return create_async_engine(settings.database_url, **_engine_options(settings))
+
+
+@lru_cache(maxsize=1)
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=get_engine(), expire_on_commit=False, autoflush=False)
+
+
+# Process-wide; fronts get_by_email for every Unit of Work in this worker.
+user_cache = TtlCache(maxsize=10_000, ttl=30.0)
+# Free list of idle Units of Work; one event loop per worker, so no locking.
+_UOW_POOL: deque[SqlAlchemyUnitOfWork] = deque(maxlen=256)
+
+
+async def _open_connection() -> None:
+    async with get_engine().connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def warm_pool() -> None:
+    """Open pool_size connections up front so first requests skip the handshake."""
+    await asyncio.gather(*(_open_connection() for _ in range(get_settings().db_pool_size)))
+
+
+async def check_io_method() -> None:
+    """Warn at startup when Postgres is not using the io_uring AIO backend (PG18+)."""
+    engine = get_engine()
+    if engine.dialect.name != "postgresql":
+        return
+    io_method: Optional[str]
+    async with engine.connect() as conn:
+        try:
+            io_method = (await conn.execute(text("SHOW io_method"))).scalar_one()
+        except DBAPIError:  # PostgreSQL < 18 has no io_method
+            io_method = None
+    if io_method != "io_uring":
+        logger.warning("Postgres io_method is %s; io_uring (PostgreSQL 18+) speeds up writes", io_method)
+
+
+def build_uow() -> SqlAlchemyUnitOfWork:
+    return SqlAlchemyUnitOfWork(get_session_factory(), user_cache)
+
+
+def acquire_uow() -> SqlAlchemyUnitOfWork:
+    """Borrow an idle Unit of Work from the pool (or build one); enter it yourself."""
+    return _UOW_POOL.pop() if _UOW_POOL else build_uow()
+
+
+def release_uow(uow: SqlAlchemyUnitOfWork) -> None:
+    """Return an exited Unit of Work to the pool without its closed session."""
+    uow.release()
+    _UOW_POOL.append(uow)
 
 
-def get_uow() -> SqlAlchemyUnitOfWork:
-    return SqlAlchemyUnitOfWork(session_factory)
+async def get_uow() -> AsyncIterator[SqlAlchemyUnitOfWork]:
+    """FastAPI dependency: one entered Unit of Work per request."""
+    # Inline acquire/release: no context-manager wrapper allocated per request.
+    uow = acquire_uow()
+    try:
+        async with uow:
+            yield uow
+    finally:
+        release_uow(uow)
@@ -3,34 +3,22 @@ import logging
 import grpc
 from typing import AsyncIterator
 
-from src.entrypoints.deps import get_uow
+from src.entrypoints.deps import acquire_uow, release_uow
 from src.service_layer import handlers
 from src.domain import models
-# Note: In a real environment, these imports would come from the generated code package.
-# For this cookbook, we assume they are available or mocked if generation isn't run.
-try:
-    from users.v1 import user_bridge_pb2, user_bridge_pb2_grpc
-except ImportError:
-    # Fallback/Mock for CI environments where proto gen hasn't run
-    logging.warning("Proto generated files not found. Using mocks for demonstration.")
-    from types import SimpleNamespace
-    user_bridge_pb2 = SimpleNamespace(
-        RegisterUserResponse=lambda **k: k,
-        GetUserResponse=lambda **k: k,
-        User=lambda **k: k,
-        UserEvent=lambda **k: k
-    )
-    user_bridge_pb2_grpc = SimpleNamespace(
-        UserServiceServicer=object,
-        add_UserServiceServicer_to_server=lambda s, x: None
-    )
+# Generated by `make proto`. No mock fallback: a missing module should fail the
+# deploy, not silently serve dicts. protobuf>=4.21 uses the C (upb) backend.
+from users.v1 import user_bridge_pb2, user_bridge_pb2_grpc
 
 logger = logging.getLogger(__name__)
 
+# Bound once so each RPC skips the module attribute lookups.
+_UserPB = user_bridge_pb2.User
+_GetUserResponsePB = user_bridge_pb2.GetUserResponse
+
 class UserService(user_bridge_pb2_grpc.UserServiceServicer):
     async def RegisterUser(self, request, context):
-        logger.info(f"Registering user via gRPC: {request.email}")
-        uow = get_uow()
+        logger.info("Registering user via gRPC: %s", request.email)
         try:
             # Note: handlers.register_user might need adaptation if it expects a command object
             # or if we are calling the domain service directly.
@@ -41,11 +29,16 @@ class UserService(user_bridge_pb2_grpc.UserServiceServicer):
             # Based on common patterns in this repo (async uow), handlers are likely async.
             
             # We map the request to the handler arguments
-            user = await handlers.register_user_service(
-                username=request.username,
-                email=request.email,
-                uow=uow
-            )
+            uow = acquire_uow()
+            try:
+                async with uow:
+                    user = await handlers.register_user_service(
+                        username=request.username,
+                        email=request.email,
+                        uow=uow
+                    )
+            finally:
+                release_uow(uow)
             
             return user_bridge_pb2.RegisterUserResponse(
                 id=str(user.id),
@@ -54,25 +47,28 @@ class UserService(user_bridge_pb2_grpc.UserServiceServicer):
                 status="active",
             )
         except Exception as e:
-            logger.error(f"Error registering user: {e}")
+            logger.error("Error registering user: %s", e)
             await context.abort(grpc.StatusCode.INTERNAL, str(e))
 
     async def GetUser(self, request, context):
-        uow = get_uow()
         # Direct UOW usage for queries (CQRS pattern: simplified)
-        async with uow:
-            found = await uow.users.get_by_email(request.email)
+        uow = acquire_uow()
+        try:
+            async with uow:
+                found = await uow.users.get_by_email(request.email)
+        finally:
+            release_uow(uow)
         
         if not found:
             await context.abort(grpc.StatusCode.NOT_FOUND, "user not found")
             
-        return user_bridge_pb2.GetUserResponse(
-            user=user_bridge_pb2.User(
+        return _GetUserResponsePB(
+            user=_UserPB(
                 id=str(found.id),
                 email=found.email,
-                username=found.name,
-                is_active=True, # Defaulting as domain model might not have it yet
-                created_at=found.created_at.isoformat() if hasattr(found, 'created_at') else "",
+                username=found.username,
+                is_active=found.is_active,
+                created_at=found.created_at.isoformat(),
             )
         )
 
@@ -87,7 +83,7 @@ class UserService(user_bridge_pb2_grpc.UserServiceServicer):
             yield user_bridge_pb2.UserEvent(
                 id="evt-123",
                 type=evt_type,
-                payload=user_bridge_pb2.User(username=user),
+                payload=_UserPB(username=user),
                 occurred_at="2023-10-27T10:00:00Z"
             )
             await asyncio.sleep(0.5)
@@ -97,7 +93,7 @@ async def serve():
     user_bridge_pb2_grpc.add_UserServiceServicer_to_server(UserService(), server)
     listen_addr = "[::]:50051"
     server.add_insecure_port(listen_addr)
-    logger.info(f"gRPC Server starting on {listen_addr}")
+    logger.info("gRPC Server starting on %s", listen_addr)
     await server.start()
     await server.wait_for_termination()
 
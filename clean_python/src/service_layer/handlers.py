@@ -11,25 +11,33 @@ async def register_user_service(
     uow: AbstractUnitOfWork
 ) -> User:
     """
-    High-Level Use Case: Register a new user.
+    High-Level Use Case: Register a new user from raw input.
     
-    1. Check constraints (async)
-    2. Create Model (sync)
-    3. Persist (sync add, async commit)
+    Validates through the domain model, then delegates to register_user.
     """
-    async with uow:
-        # 1. Check if user already exists
-        existing = await uow.users.get_by_email(email)
-        if existing:
-            logger.info("Registration attempt for existing user", extra={"email_hash": hash(email)})
-            raise ValueError("User already exists")  # Don't expose email in error
-        
-        # 2. Invoke Domain Logic
-        user = User(username=username, email=email)
-        
-        # 3. Save and Commit (add is now synchronous)
-        uow.users.add(user)
-        await uow.commit()
-        
+    # 1. Invoke Domain Logic
+    return await register_user(User(username=username, email=email), uow)
+
+
+async def register_user(user: User, uow: AbstractUnitOfWork) -> User:
+    """
+    Register an already-validated User (e.g. built from a validated DTO).
+    
+    Expects an already-entered Unit of Work; uncommitted work is rolled
+    back when the caller's ``async with uow`` block exits.
+
+    1. Insert unless the email exists (async, single round-trip)
+    2. Commit (async)
+    """
+    # 1. Insert; the unique email index settles concurrent duplicates
+    if not await uow.users.add_if_absent(user):
+        if logger.isEnabledFor(logging.INFO):  # skip building extra when INFO is off
+            logger.info("Registration attempt for existing user", extra={"email_hash": hash(user.email)})
+        raise ValueError("User already exists")  # Don't expose email in error
+    
+    # 2. Commit
+    await uow.commit()
+    
+    if logger.isEnabledFor(logging.INFO):
         logger.info("User registered successfully", extra={"user_id": str(user.id)})
-        return user
+    return user
@@ -1,5 +1,7 @@
-from typing import Protocol, Self, Callable
+from typing import Optional, Protocol, Self, Callable
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.adapters.cache import TtlCache
+from src.adapters.orm import SqlAlchemyUserRepository
 from src.domain.ports import UserRepository
 
 class AbstractUnitOfWork(Protocol):
@@ -16,12 +18,17 @@ class SqlAlchemyUnitOfWork:
     Manages the atomicity of the business transaction.
     Either everything happens, or nothing happens.
     """
-    def __init__(self, session_factory: Callable[[], AsyncSession]):
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        user_cache: Optional[TtlCache] = None,
+    ):
         self.session_factory = session_factory
+        self.user_cache = user_cache
+        self._users: Optional[SqlAlchemyUserRepository] = None
 
     async def __aenter__(self) -> Self:
         self.session: AsyncSession = self.session_factory()
-        self.users = SqlAlchemyUserRepository(self.session)
         return self
 
     async def __aexit__(self, exc_type, *args):
@@ -33,10 +40,26 @@ class SqlAlchemyUnitOfWork:
         finally:
             await self.session.close()
 
+    @property
+    def users(self) -> SqlAlchemyUserRepository:
+        """Repository bound to the current session, built on first use per session."""
+        if self._users is None or self._users.session is not self.session:
+            self._users = SqlAlchemyUserRepository(self.session, self.user_cache)
+        return self._users
+
+    def release(self) -> None:
+        """Drop the closed session and its repository after exit (e.g. before pooling)."""
+        self.__dict__.pop("session", None)  # unset if __aenter__ never ran
+        self._users = None
+
     async def commit(self) -> None:
         """Commit the current transaction."""
         await self.session.commit()
+        if self._users is not None:
+            self._users.publish_written()
 
     async def rollback(self) -> None:
         """Rollback the current transaction."""
         await self.session.rollback()
+        if self._users is not None:
+            self._users.discard_written()
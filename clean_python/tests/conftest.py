@@ -1,21 +1,13 @@
-import asyncio
 import pytest
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from src.adapters.cache import TtlCache
 from src.adapters.orm import Base
 from src.service_layer.unit_of_work import SqlAlchemyUnitOfWork
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
-
-
-@pytest.fixture
 async def db_engine():
-    """Create in-memory database engine for testing."""
+    """Create one in-memory database engine; schema DDL runs once per session."""
     engine = create_async_engine("sqlite+aiosqlite:///:memory:")
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -24,7 +16,31 @@ async def db_engine():
 
 
 @pytest.fixture
-async def uow(db_engine):
+async def clean_db(db_engine):
+    """Isolate tests by emptying every table afterwards instead of recreating the schema."""
+    yield db_engine
+    async with db_engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
+
+
+@pytest.fixture
+async def uow(clean_db):
     """Provide Unit of Work for tests."""
-    session_factory = async_sessionmaker(bind=db_engine, expire_on_commit=False)
+    session_factory = async_sessionmaker(bind=clean_db, expire_on_commit=False, autoflush=False)
     return SqlAlchemyUnitOfWork(session_factory)
+
+
+@pytest.fixture
+async def cached_uow(clean_db):
+    """Provide a Unit of Work whose repository fronts reads with a TTL cache."""
+    session_factory = async_sessionmaker(bind=clean_db, expire_on_commit=False, autoflush=False)
+    return SqlAlchemyUnitOfWork(session_factory, TtlCache(maxsize=10, ttl=30.0))
+
+
+@pytest.fixture
+async def test_db_session(clean_db):
+    """Provide a bare AsyncSession for adapter tests."""
+    session_factory = async_sessionmaker(bind=clean_db, expire_on_commit=False, autoflush=False)
+    async with session_factory() as session:
+        yield session
@@ -0,0 +1,46 @@
+from src.adapters.cache import TtlCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_returns_value_until_ttl_expires():
+    """Test that entries are served until their TTL elapses."""
+    clock = FakeClock()
+    cache = TtlCache(maxsize=10, ttl=30.0, timer=clock)
+    cache.set("a@example.com", "alice")
+
+    clock.now = 29.9
+    assert cache.get("a@example.com") == "alice"
+
+    clock.now = 30.0
+    assert cache.get("a@example.com") is None
+
+
+def test_cache_per_entry_ttl_overrides_default():
+    """Test that a short per-entry TTL (negative caching) expires first."""
+    clock = FakeClock()
+    cache = TtlCache(maxsize=10, ttl=30.0, timer=clock)
+    cache.set("missing@example.com", None, ttl=1.0)
+
+    assert cache.get("missing@example.com", "miss") is None
+    clock.now = 1.0
+    assert cache.get("missing@example.com", "miss") == "miss"
+
+
+def test_cache_evicts_least_recently_used():
+    """Test that exceeding maxsize drops the least recently read entry."""
+    cache = TtlCache(maxsize=2, ttl=30.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
@@ -1,18 +1,19 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+
 import pytest
+from sqlalchemy import delete
 
-from src.adapters.orm import SqlAlchemyUserRepository
+from src.adapters.cache import TtlCache
+from src.adapters.orm import SqlAlchemyUserRepository, UserRecord
 from src.domain.models import User
+from src.service_layer.unit_of_work import SqlAlchemyUnitOfWork
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
 
-pytestmark = pytest.mark.asyncio
-
-
 async def test_repository_can_add_and_get_user(test_db_session: AsyncSession):
     """
     Test that the repository can add a user to the database and retrieve it.
@@ -21,7 +22,7 @@ async def test_repository_can_add_and_get_user(test_db_session: AsyncSession):
     user = User(username="testuser", email="test@example.com")
 
     # Add user and commit
-    await repo.add(user)
+    repo.add(user)
     await test_db_session.commit()
 
     # Retrieve user
@@ -41,4 +42,102 @@ async def test_repository_get_returns_none_for_nonexistent_user(
     """
     repo = SqlAlchemyUserRepository(test_db_session)
     retrieved_user = await repo.get_by_email("nonexistent@example.com")
-    assert retrieved_user is None
\ No newline at end of file
+    assert retrieved_user is None
+
+async def test_repository_add_many_inserts_across_batches(test_db_session: AsyncSession):
+    """
+    Test that add_many persists every user, including past one batch boundary.
+    """
+    repo = SqlAlchemyUserRepository(test_db_session)
+    users = [
+        User(username=f"user{i}", email=f"user{i}@example.com") for i in range(1001)
+    ]
+
+    await repo.add_many(users)
+    await test_db_session.commit()
+
+    assert await repo.get_by_email("user0@example.com") is not None
+    assert await repo.get_by_email("user1000@example.com") is not None
+
+
+def test_lower_email_is_the_only_unique_rule_on_email():
+    """
+    Test that ON CONFLICT (lower(email)) is the sole arbiter for duplicate emails.
+    """
+    table = UserRecord.__table__
+    unique_indexes = [ix.name for ix in table.indexes if ix.unique]
+
+    assert unique_indexes == ["ix_users_email_lower"]
+    assert not table.c.email.unique
+
+
+async def test_repository_serves_repeat_lookups_from_cache(test_db_session: AsyncSession):
+    """
+    Test that a cached user is returned without another query.
+    """
+    repo = SqlAlchemyUserRepository(test_db_session, TtlCache(maxsize=10, ttl=30.0))
+    repo.add(User(username="testuser", email="test@example.com"))
+    await test_db_session.commit()
+    first = await repo.get_by_email("test@example.com")
+
+    await test_db_session.execute(delete(UserRecord))
+    await test_db_session.commit()
+
+    assert await repo.get_by_email("Test@Example.com") is first
+
+
+@pytest.mark.parametrize("method", ["add", "add_many", "add_if_absent"])
+async def test_commit_evicts_cached_absence_for_every_write_path(
+    cached_uow: SqlAlchemyUnitOfWork, method: str
+):
+    """
+    Test that every write path drops a cached "not found" once the UoW commits.
+    """
+    user = User(username="testuser", email="test@example.com")
+    async with cached_uow:
+        assert await cached_uow.users.get_by_email("test@example.com") is None
+        if method == "add":
+            cached_uow.users.add(user)
+        elif method == "add_many":
+            await cached_uow.users.add_many([user])
+        else:
+            assert await cached_uow.users.add_if_absent(user)
+        await cached_uow.commit()
+
+        assert await cached_uow.users.get_by_email("test@example.com") is not None
+
+
+async def test_absence_cached_between_write_and_commit_is_evicted(
+    cached_uow: SqlAlchemyUnitOfWork,
+):
+    """
+    Test that a reader caching "not found" before COMMIT cannot hide the new row.
+    """
+    async with cached_uow:
+        cached_uow.users.add(User(username="testuser", email="test@example.com"))
+        # Another session looked the email up after the INSERT, before COMMIT.
+        cached_uow.user_cache.set("test@example.com", None, ttl=1.0)
+        await cached_uow.commit()
+
+        assert await cached_uow.users.get_by_email("test@example.com") is not None
+
+
+async def test_repository_negative_cache_entries_expire(test_db_session: AsyncSession):
+    """
+    Test that a cached "not found" lasts one second, then the database is asked again.
+    """
+    now = [0.0]
+    cache = TtlCache(maxsize=10, ttl=30.0, timer=lambda: now[0])
+    repo = SqlAlchemyUserRepository(test_db_session, cache)
+    assert await repo.get_by_email("test@example.com") is None
+
+    # Written through an uncached repository, as another process would.
+    SqlAlchemyUserRepository(test_db_session).add(
+        User(username="testuser", email="test@example.com")
+    )
+    await test_db_session.commit()
+
+    now[0] = 0.9
+    assert await repo.get_by_email("test@example.com") is None
+    now[0] = 1.0
+    assert await repo.get_by_email("test@example.com") is not None
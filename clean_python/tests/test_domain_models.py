@@ -24,6 +24,12 @@ def test_username_validator_rejects_invalid_name():
         User(username="invalid-user!", email="test@example.com")
 
 
+def test_email_is_normalized_to_lowercase():
+    """Test that the domain stores one canonical form of the email."""
+    user = User(username="testuser", email="Test@Example.COM")
+    assert user.email == "test@example.com"
+
+
 def test_can_receive_email_for_active_user():
     """Test that an active user can receive emails."""
     user = User(username="test", email="test@example.com", is_active=True)
@@ -33,4 +39,29 @@ def test_can_receive_email_for_active_user():
 def test_can_receive_email_for_inactive_user():
     """Test that an inactive user cannot receive emails."""
     user = User(username="test", email="test@example.com", is_active=False)
-    assert not user.can_receive_email()
\ No newline at end of file
+    assert not user.can_receive_email()
+
+def test_username_validator_rejects_non_ascii_letters():
+    """Test that non-ASCII letters are rejected even though str.isalpha accepts them."""
+    with pytest.raises(ValueError, match="Username must start with letter"):
+        User(username="józef", email="test@example.com")
+
+
+def test_user_rejects_unknown_fields():
+    """Test that unexpected fields are refused rather than silently dropped."""
+    with pytest.raises(ValueError, match="Extra inputs are not permitted"):
+        User(username="testuser", email="test@example.com", role="admin")
+
+
+def test_user_is_immutable():
+    """Test that a User cannot be changed in place once built."""
+    user = User(username="testuser", email="test@example.com")
+    with pytest.raises(ValueError, match="frozen"):
+        user.is_active = False
+
+
+def test_fast_new_skips_validation_for_trusted_data():
+    """Test that fast_new builds a User without re-running validators."""
+    user = User.fast_new(username="Trusted", email="test@example.com")
+    assert user.username == "Trusted"  # not re-normalized
+    assert user.id is not None
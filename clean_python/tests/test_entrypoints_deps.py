@@ -0,0 +1,20 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_importing_deps_does_not_parse_settings():
+    """Test that the engine and settings are only built on first use."""
+    # A fresh interpreter: reloading deps here would swap get_uow and the
+    # pool out from under modules (e.g. the API) that already imported them.
+    env = {k: v for k, v in os.environ.items() if k not in ("DATABASE_URL", "SECRET_KEY")}
+    code = (
+        "from src.config import get_settings\n"
+        "from src.entrypoints import deps\n"
+        "assert get_settings.cache_info().currsize == 0\n"
+        "assert deps.get_engine.cache_info().currsize == 0\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, env=env, check=True)
@@ -1,15 +1,17 @@
 import pytest
+from sqlalchemy import delete
+
+from src.adapters.orm import UserRecord
 from src.domain.models import User
 from src.service_layer import handlers
 
-pytestmark = pytest.mark.asyncio
-
 
 async def test_register_user_service_happy_path(uow):
     """Test that a user can be successfully registered."""
-    user = await handlers.register_user_service(
-        "testuser", "test@example.com", uow
-    )
+    async with uow:
+        user = await handlers.register_user_service(
+            "testuser", "test@example.com", uow
+        )
 
     assert user.username == "testuser"
     assert user.email == "test@example.com"
@@ -30,6 +32,55 @@ async def test_register_user_service_raises_error_if_user_exists(uow):
 
     # Attempt to register the same user and expect an error
     with pytest.raises(ValueError, match="User already exists"):
-        await handlers.register_user_service(
-            "newuser", "test@example.com", uow
-        )
\ No newline at end of file
+        async with uow:
+            await handlers.register_user_service(
+                "newuser", "test@example.com", uow
+            )
+
+async def test_register_user_service_treats_email_case_insensitively(uow):
+    """Test that an email differing only in case counts as an existing user."""
+    async with uow:
+        await handlers.register_user_service("testuser", "test@example.com", uow)
+
+    with pytest.raises(ValueError, match="User already exists"):
+        async with uow:
+            await handlers.register_user_service(
+                "newuser", "Test@Example.COM", uow
+            )
+
+
+async def test_register_user_service_returns_normalized_email(uow):
+    """Test that the returned user carries the same email as the stored row."""
+    async with uow:
+        user = await handlers.register_user_service("testuser", "A@Example.com", uow)
+
+    async with uow:
+        stored = await uow.users.get_by_email("a@example.com")
+
+    assert user.email == stored.email == "a@example.com"
+
+
+async def test_register_user_accepts_prebuilt_user(uow):
+    """Test that an already-validated User is registered without rebuilding it."""
+    user = User.fast_new(username="testuser", email="test@example.com")
+    async with uow:
+        registered = await handlers.register_user(user, uow)
+
+    assert registered is user
+    async with uow:
+        assert await uow.users.get_by_email("test@example.com") is not None
+
+
+async def test_duplicate_registration_is_refused_from_the_cache(cached_uow):
+    """Test that a retried registration is rejected without another INSERT."""
+    async with cached_uow:
+        await handlers.register_user_service("testuser", "test@example.com", cached_uow)
+
+    # Remove the row behind the cache's back; only the cache can refuse now.
+    async with cached_uow:
+        await cached_uow.session.execute(delete(UserRecord))
+        await cached_uow.commit()
+
+    with pytest.raises(ValueError, match="User already exists"):
+        async with cached_uow:
+            await handlers.register_user_service("testuser", "test@example.com", cached_uow)
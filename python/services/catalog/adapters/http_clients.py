@@ -1,42 +1,54 @@
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, ClassVar
+
+import httpx
+import orjson
 
 from ..domain.models import Inventory, Price
 
 
+def _timeout(timeout: float | None) -> object:
+    # httpx reads an explicit None as "no timeout"; omitted means the client's own.
+    return httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+
+
 @dataclass(slots=True)
 class InventoryHttpClient:
     http: Any  # expect an httpx.AsyncClient-like object
+    _PREFIX: ClassVar[str] = "/inventory/"
 
     async def get(self, product_id: str, *, timeout: float | None = None) -> Inventory:
-        resp = await self.http.get(f"/inventory/{product_id}", timeout=timeout)
+        resp = await self.http.get(self._PREFIX + product_id, timeout=_timeout(timeout))
         resp.raise_for_status()
-        data = resp.json()
-        return Inventory(available=int(data["available"]))
+        data = orjson.loads(resp.content)
+        return Inventory(available=data["available"])
 
 
 @dataclass(slots=True)
 class PricingHttpClient:
     http: Any
+    _PREFIX: ClassVar[str] = "/pricing/"
 
     async def get(self, product_id: str, *, timeout: float | None = None) -> Price:
-        resp = await self.http.get(f"/pricing/{product_id}", timeout=timeout)
+        resp = await self.http.get(self._PREFIX + product_id, timeout=_timeout(timeout))
         resp.raise_for_status()
-        data = resp.json()
-        return Price(currency=data["currency"], amount=float(data["amount"]))
+        data = orjson.loads(resp.content)
+        return Price(currency=data["currency"], amount=data["amount"])
 
 
 @dataclass(slots=True)
 class ReviewsHttpClient:
     http: Any
+    _PREFIX: ClassVar[str] = "/reviews/"
 
     async def get(self, product_id: str, *, timeout: float | None = None) -> list[str]:
-        resp = await self.http.get(f"/reviews/{product_id}", timeout=timeout)
+        resp = await self.http.get(self._PREFIX + product_id, timeout=_timeout(timeout))
         resp.raise_for_status()
-        data = resp.json()
-        # Safeguard against slow endpoints by streaming if supported; simplified here
-        await asyncio.sleep(0)
-        return [str(r) for r in data.get("reviews", [])]
+        data = orjson.loads(resp.content)
+        reviews = data.get("reviews") or []
+        # Upstream normally sends strings; only copy when coercion is needed.
+        if all(isinstance(r, str) for r in reviews):
+            return reviews
+        return [str(r) for r in reviews]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
-from asyncio import TaskGroup, TimeoutError
+from functools import partial
+
+from cachetools import TTLCache
 
 from ..domain.models import Product
 from ..ports import InventoryClient, PricingClient, ReviewsClient
@@ -21,26 +23,71 @@ async def fetch_product(
 ) -> Product:
     """
     Fan-out to three upstreams with a shared deadline.
-    Cancels siblings on timeout and bubbles a typed error.
+    Cancels siblings on timeout or error and bubbles a typed error.
     """
+    # The outer wait_for is the single deadline; per-call timeouts add a timer each.
+    tasks = (
+        asyncio.ensure_future(inventory.get(product_id)),
+        asyncio.ensure_future(pricing.get(product_id)),
+        asyncio.ensure_future(reviews.get(product_id)),
+    )
     try:
-        async with TaskGroup() as tg:
-            inv_task = tg.create_task(inventory.get(product_id, timeout=timeout_seconds))
-            price_task = tg.create_task(pricing.get(product_id, timeout=timeout_seconds))
-            reviews_task = tg.create_task(reviews.get(product_id, timeout=timeout_seconds))
-    except (TimeoutError, ExceptionGroup) as exc:
-        # Python 3.11+ wraps TimeoutError in ExceptionGroup when using TaskGroup
-        if isinstance(exc, ExceptionGroup):
-            # Check if any sub-exception is TimeoutError
-            for sub_exc in exc.exceptions:
-                if isinstance(sub_exc, (TimeoutError, asyncio.TimeoutError)):
-                    raise UpstreamTimeout("Upstream timed out") from exc
-            # Re-raise if it's not a timeout
-            raise
+        inv, price, revs = await asyncio.wait_for(
+            asyncio.gather(*tasks), timeout=timeout_seconds
+        )
+    except asyncio.TimeoutError as exc:
         raise UpstreamTimeout("Upstream timed out") from exc
+    finally:
+        # gather() leaves siblings running when one fails; no-op for finished tasks.
+        for task in tasks:
+            task.cancel()
+
+    return Product(id=product_id, inventory=inv, price=price, reviews=revs)
+
+
+class ProductCache:
+    """
+    Short-TTL read-through cache over fetch_product.
+    Concurrent misses for one product share a single in-flight fan-out.
+    """
+
+    __slots__ = ("_cache", "_inflight")
+
+    def __init__(self, *, maxsize: int = 10_000, ttl: float = 0.5) -> None:
+        self._cache: TTLCache[str, Product] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._inflight: dict[str, asyncio.Future[Product]] = {}
 
-    inv = await inv_task
-    price = await price_task
-    revs = await reviews_task
+    async def fetch(
+        self,
+        product_id: str,
+        *,
+        inventory: InventoryClient,
+        pricing: PricingClient,
+        reviews: ReviewsClient,
+        timeout_seconds: float = 0.2,
+    ) -> Product:
+        product = self._cache.get(product_id)
+        if product is not None:
+            return product
+        # No await between lookup and insert, so the dict needs no lock.
+        future = self._inflight.get(product_id)
+        if future is None:
+            future = asyncio.ensure_future(
+                fetch_product(
+                    product_id,
+                    inventory=inventory,
+                    pricing=pricing,
+                    reviews=reviews,
+                    timeout_seconds=timeout_seconds,
+                )
+            )
+            self._inflight[product_id] = future
+            future.add_done_callback(partial(self._settle, product_id))
+        # shield: one caller disconnecting must not cancel the shared fan-out.
+        return await asyncio.shield(future)
 
-    return Product(id=product_id, inventory=inv, price=price, reviews=revs or [])
+    def _settle(self, product_id: str, future: asyncio.Future[Product]) -> None:
+        del self._inflight[product_id]
+        # Failures are not cached; the next request retries the upstreams.
+        if not future.cancelled() and future.exception() is None:
+            self._cache[product_id] = future.result()
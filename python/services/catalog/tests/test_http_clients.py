@@ -0,0 +1,71 @@
+import httpx
+import pytest
+
+from python.services.catalog.adapters.http_clients import (
+    InventoryHttpClient,
+    PricingHttpClient,
+    ReviewsHttpClient,
+)
+
+
+def make_http(payloads: dict[str, dict]) -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=payloads[request.url.path])
+
+    return httpx.AsyncClient(
+        base_url="http://upstream", transport=httpx.MockTransport(handler)
+    )
+
+
+@pytest.mark.asyncio
+async def test_http_clients_parse_upstream_payloads():
+    http = make_http(
+        {
+            "/inventory/p1": {"available": 3},
+            "/pricing/p1": {"currency": "USD", "amount": 9.99},
+            "/reviews/p1": {"reviews": ["ok", "great"]},
+        }
+    )
+
+    async with http:
+        inv = await InventoryHttpClient(http).get("p1")
+        price = await PricingHttpClient(http).get("p1")
+        reviews = await ReviewsHttpClient(http).get("p1")
+
+    assert inv.available == 3
+    assert (price.currency, price.amount) == ("USD", 9.99)
+    assert reviews == ["ok", "great"]
+
+
+@pytest.mark.asyncio
+async def test_reviews_client_coerces_non_string_and_missing_reviews():
+    http = make_http(
+        {"/reviews/p1": {"reviews": ["ok", 5]}, "/reviews/p2": {"reviews": None}}
+    )
+
+    async with http:
+        client = ReviewsHttpClient(http)
+        assert await client.get("p1") == ["ok", "5"]
+        assert await client.get("p2") == []
+
+
+@pytest.mark.asyncio
+async def test_http_clients_fall_back_to_the_client_timeout():
+    seen: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"])
+        return httpx.Response(200, json={"available": 3})
+
+    http = httpx.AsyncClient(
+        base_url="http://upstream",
+        transport=httpx.MockTransport(handler),
+        timeout=httpx.Timeout(0.5),
+    )
+
+    async with http:
+        client = InventoryHttpClient(http)
+        await client.get("p1")
+        await client.get("p1", timeout=0.1)
+
+    assert [t["read"] for t in seen] == [0.5, 0.1]
@@ -3,22 +3,23 @@ import pytest
 
 from python.services.catalog.domain.models import Inventory, Price
 from python.services.catalog.service_layer.queries import (
+    ProductCache,
     UpstreamTimeout,
     fetch_product,
 )
 
 
 class StubClient:
+    __slots__ = ("value", "delay", "raises", "calls")
+
     def __init__(self, value, delay: float = 0.0, raises: Exception | None = None):
         self.value = value
         self.delay = delay
         self.raises = raises
+        self.calls = 0
 
     async def get(self, product_id: str, *, timeout: float | None = None):
-        if self.delay and timeout and self.delay > timeout:
-            # mimic upstream timeout
-            await asyncio.sleep(timeout)
-            raise asyncio.TimeoutError
+        self.calls += 1
         if self.delay:
             await asyncio.sleep(self.delay)
         if self.raises:
@@ -52,3 +53,50 @@ async def test_fetch_product_timeout_bubbles():
         await fetch_product(
             "p1", inventory=inv, pricing=price, reviews=reviews, timeout_seconds=0.1
         )
+
+
+@pytest.mark.asyncio
+async def test_fetch_product_error_cancels_siblings():
+    inv = StubClient(Inventory(available=3), raises=RuntimeError("boom"))
+    price = StubClient(Price(currency="USD", amount=9.99), delay=0.05)
+    reviews = StubClient(["ok"], delay=0.05)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await fetch_product(
+            "p1", inventory=inv, pricing=price, reviews=reviews, timeout_seconds=0.2
+        )
+
+    pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    await asyncio.sleep(0)
+    assert all(t.done() for t in pending)
+
+
+@pytest.mark.asyncio
+async def test_product_cache_dedupes_concurrent_misses_and_serves_hits():
+    inv = StubClient(Inventory(available=3), delay=0.01)
+    price = StubClient(Price(currency="USD", amount=9.99))
+    reviews = StubClient(["ok"])
+    cache = ProductCache(ttl=60)
+
+    def fetch():
+        return cache.fetch("p1", inventory=inv, pricing=price, reviews=reviews)
+
+    first, second = await asyncio.gather(fetch(), fetch())
+    third = await fetch()
+
+    assert first is second is third
+    assert inv.calls == price.calls == reviews.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_product_cache_does_not_cache_failures():
+    inv = StubClient(Inventory(available=3), raises=RuntimeError("boom"))
+    price = StubClient(Price(currency="USD", amount=9.99))
+    reviews = StubClient(["ok"])
+    cache = ProductCache(ttl=60)
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="boom"):
+            await cache.fetch("p1", inventory=inv, pricing=price, reviews=reviews)
+
+    assert inv.calls == 2